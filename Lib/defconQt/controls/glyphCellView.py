@@ -21,12 +21,17 @@ from defconQt.representationFactories.glyphCellFactory import (
     GlyphCellMinHeightForHeader,
 )
 from defconQt.tools import platformSpecific
+from defconQt.tools.glyphCellRenderer import GlyphCellRenderer, drawingControllerFactory
 from defconQt.tools.glyphsMimeData import GlyphsMimeData
 
 backgroundColor = Qt.white
 cellGridColor = QColor(190, 190, 190)
+cellPlaceholderColor = QColor(246, 246, 246)
 insertionPositionColor = QColor.fromRgbF(0.16, 0.3, 0.85, 1)
 
+visibleCellPriority = 1
+prefetchCellPriority = 0
+
 cacheBustSize = 10
 
 
@@ -63,6 +68,7 @@ class GlyphCellWidget(QWidget):
         self._cellWidthExtra = 0
         self._cellSizeCache = set()
         self._glyphs = []
+        self._glyphIndexes = {}
 
         self._inputString = ""
         self._lastKeyInputTime = None
@@ -78,6 +84,13 @@ class GlyphCellWidget(QWidget):
         self._cellRepresentationName = "defconQt.GlyphCell"
         self._cellRepresentationArguments = {}
 
+        self._cellRenderer = GlyphCellRenderer(self)
+        self._cellRenderer.cellRendered.connect(self._cellRendered)
+
+        self._paintStatistics = dict(
+            count=0, cells=0, lastDuration=0.0, totalDuration=0.0
+        )
+
     # --------------
     # Custom methods
     # --------------
@@ -89,25 +102,82 @@ class GlyphCellWidget(QWidget):
         scrollArea.setWidget(self)
         self._scrollArea = scrollArea
 
-    def _getCurrentRepresentation(self, glyph):
-        name = self._cellRepresentationName
+    def _getCurrentRepresentationArguments(self):
         args = self._cellRepresentationArguments
         args["width"] = self._cellWidth + 2 * self._cellWidthExtra
         args["height"] = self._cellHeight
         args["pixelRatio"] = self.devicePixelRatio()
 
         self._cellSizeCache.add((args["width"], args["height"]))
+        return args
+
+    def _getCurrentRepresentation(self, glyph):
+        name = self._cellRepresentationName
+        args = self._getCurrentRepresentationArguments()
         return glyph.getRepresentation(name, **args)
 
+    def _getCurrentCellPixmap(self, glyph, priority=visibleCellPriority):
+        """
+        Returns the cell pixmap of *glyph*, which may be out of date, or None.
+
+        If the cell needs drawing and the current cell representation has
+        a drawing controller factory, it is queued in the cell renderer with
+        *priority*. Otherwise, the cell is drawn synchronously.
+        """
+        name = self._cellRepresentationName
+        factory = drawingControllerFactory(name)
+        if factory is None:
+            if priority < visibleCellPriority:
+                return None
+            return self._getCurrentRepresentation(glyph)
+        args = self._getCurrentRepresentationArguments()
+        key = (glyph, name, frozenset(args.items()))
+        self._cellRenderer.requestRender(key, lambda: factory(glyph, **args), priority)
+        return self._cellRenderer.pixmap(key)
+
+    def _cellRendered(self, key):
+        if key[1] != self._cellRepresentationName:
+            return
+        index = self.indexForGlyph(key[0])
+        if index is None or not self._columnCount:
+            return
+        cellWidth = self._cellWidth + 2 * self._cellWidthExtra
+        cellHeight = self._cellHeight
+        self.update(
+            (index % self._columnCount) * cellWidth,
+            (index // self._columnCount) * cellHeight,
+            cellWidth,
+            cellHeight,
+        )
+
+    def invalidateCells(self, glyphs=None):
+        """
+        Marks the cells of *glyphs*, or of all glyphs if None, as out of date.
+        They will be drawn again next time they are shown.
+        """
+        if glyphs is None:
+            self._cellRenderer.invalidate()
+        else:
+            self._cellRenderer.invalidate(glyphs)
+        self.update()
+
     def preloadGlyphCellImages(self):
         """
-        This preloads the glyphs’ current cell representations in the defcon
-        representations_ cache.
+        This queues drawing of the glyphs’ current cell images in the
+        background, behind the visible cells.
+
+        If the current cell representation has no drawing controller factory,
+        this preloads the cell representations in the defcon representations_
+        cache instead.
 
         .. _representations: http://ts-defcon.readthedocs.org/en/ufo3/concepts/representations.html
         """
+        if drawingControllerFactory(self._cellRepresentationName) is None:
+            for glyph in self._glyphs:
+                self._getCurrentRepresentation(glyph)
+            return
         for glyph in self._glyphs:
-            self._getCurrentRepresentation(glyph)
+            self._getCurrentCellPixmap(glyph, prefetchCellPriority)
 
     def glyphs(self):
         """
@@ -127,13 +197,43 @@ class GlyphCellWidget(QWidget):
         .. _Glyph: http://ts-defcon.readthedocs.org/en/ufo3/objects/glyph.html
         """
         currentSelection = [self._glyphs[index] for index in self._selection]
+        self._setGlyphs(glyphs)
+        glyphIndexes = self._glyphIndexes
         newSelection = {
-            glyphs.index(glyph) for glyph in currentSelection if glyph in glyphs
+            glyphIndexes[glyph] for glyph in currentSelection if glyph in glyphIndexes
         }
-        self._glyphs = glyphs
         self.setSelection(newSelection)
         self.adjustSize()
 
+    def _setGlyphs(self, glyphs):
+        self._glyphs = glyphs
+        self._updateGlyphIndexes()
+
+    def _updateGlyphIndexes(self):
+        glyphIndexes = {}
+        # iterate backwards so that duplicate glyphs map to their first index,
+        # like list.index()
+        for index in range(len(self._glyphs) - 1, -1, -1):
+            glyphIndexes[self._glyphs[index]] = index
+        self._glyphIndexes = glyphIndexes
+
+    def indexForGlyph(self, glyph):
+        """
+        Returns the index of *glyph* in this widget’s glyphs, or None if the
+        glyph isn’t displayed.
+
+        This lookup runs in constant time.
+        """
+        index = self._glyphIndexes.get(glyph)
+        if index is not None:
+            if index < len(self._glyphs) and self._glyphs[index] is glyph:
+                return index
+        elif len(self._glyphIndexes) == len(self._glyphs):
+            return None
+        # the glyphs list was modified in place, rebuild the map
+        self._updateGlyphIndexes()
+        return self._glyphIndexes.get(glyph)
+
     def glyphsForIndexes(self, indexes):
         """
         Returns a list of glyphs that are at *indexes*.
@@ -198,6 +298,30 @@ class GlyphCellWidget(QWidget):
         self._cellRepresentationArguments = kwargs
         self.update()
 
+    def paintStatistics(self):
+        """
+        Returns a dict with timing information about the paint events handled
+        so far:
+
+        - *count*: the number of paint events
+        - *cells*: the number of cells drawn in the last paint event
+        - *lastDuration*: the duration of the last paint event, in seconds
+        - *totalDuration*: the cumulated duration of all paint events
+
+        Only the cells intersecting the exposed rect are drawn, so the cost
+        of a paint event depends on the viewport size rather than on the
+        number of glyphs.
+        """
+        return dict(self._paintStatistics)
+
+    def resetPaintStatistics(self):
+        """
+        Resets the counters returned by :meth:`paintStatistics`.
+        """
+        self._paintStatistics.update(
+            count=0, cells=0, lastDuration=0.0, totalDuration=0.0
+        )
+
     # selection
 
     def selection(self):
@@ -252,8 +376,13 @@ class GlyphCellWidget(QWidget):
         if len(self._cellSizeCache) >= cacheBustSize:
             for glyph in self._glyphs:
                 glyph.destroyRepresentation(self._cellRepresentationName)
+            self._cellRenderer.clear()
             self._cellSizeCache = set()
 
+    def _drawCellPlaceholder(self, painter, rect):
+        x, y, w, h = rect
+        painter.fillRect(QRectF(x + 1, y + 1, w - 2, h - 2), cellPlaceholderColor)
+
     # ----------
     # Qt methods
     # ----------
@@ -281,59 +410,77 @@ class GlyphCellWidget(QWidget):
         return QSize(newWidth, newHeight)
 
     def paintEvent(self, event):
+        paintStart = time.perf_counter()
         painter = QPainter(self)
         visibleRect = event.rect()
         columnCount = self._columnCount
         extra = self._cellWidthExtra
         cellWidth, cellHeight = self._cellWidth + 2 * extra, self._cellHeight
         glyphCount = len(self._glyphs)
-        if columnCount:
-            paintWidth = min(glyphCount, columnCount) * cellWidth
-        else:
-            paintWidth = 0
-        left = 0
-        top = cellHeight
 
         painter.fillRect(visibleRect, Qt.white)
-        for index, glyph in enumerate(self._glyphs):
-            t = top - cellHeight
-            rect = (left, t, cellWidth, cellHeight)
-
-            if visibleRect.intersects(visibleRect.__class__(*rect)):
-                if index in self._selection:
-                    palette = self.palette()
-                    active = palette.currentColorGroup() != QPalette.Inactive
-                    opacityMultiplier = platformSpecific.colorOpacityMultiplier()
-                    selectionColor = palette.color(QPalette.Highlight)
-                    # TODO: alpha values somewhat arbitrary (here and in
-                    # glyphLineView)
-                    selectionColor.setAlphaF(0.2 * opacityMultiplier if active else 0.7)
-                    painter.fillRect(
-                        QRectF(left, t, cellWidth, cellHeight), selectionColor
-                    )
-
-                pixmap = self._getCurrentRepresentation(glyph)
-                painter.drawPixmap(left, t, pixmap)
-
-                # XXX: this hacks around the repr internals
-                if (
-                    index in self._selection
-                    and cellHeight >= GlyphCellMinHeightForHeader
-                ):
-                    painter.fillRect(
-                        QRectF(
-                            left,
-                            t + cellHeight - GlyphCellHeaderHeight,
-                            cellWidth,
-                            GlyphCellHeaderHeight,
-                        ),
-                        selectionColor,
-                    )
-
-            left += cellWidth
-            if left + cellWidth > paintWidth:
-                left = 0
-                top += cellHeight
+        # only walk the cells that intersect the exposed rect
+        cellCount = 0
+        if columnCount and cellWidth and cellHeight:
+            firstRow = max(0, visibleRect.top() // cellHeight)
+            lastRow = visibleRect.bottom() // cellHeight
+            firstColumn = max(0, visibleRect.left() // cellWidth)
+            lastColumn = min(columnCount - 1, visibleRect.right() // cellWidth)
+            if self._selection:
+                palette = self.palette()
+                active = palette.currentColorGroup() != QPalette.Inactive
+                opacityMultiplier = platformSpecific.colorOpacityMultiplier()
+                selectionColor = palette.color(QPalette.Highlight)
+                # TODO: alpha values somewhat arbitrary (here and in
+                # glyphLineView)
+                selectionColor.setAlphaF(0.2 * opacityMultiplier if active else 0.7)
+            for row in range(firstRow, lastRow + 1):
+                rowStart = row * columnCount
+                if rowStart >= glyphCount:
+                    break
+                t = row * cellHeight
+                for column in range(firstColumn, lastColumn + 1):
+                    index = rowStart + column
+                    if index >= glyphCount:
+                        break
+                    glyph = self._glyphs[index]
+                    left = column * cellWidth
+                    selected = index in self._selection
+                    if selected:
+                        painter.fillRect(
+                            QRectF(left, t, cellWidth, cellHeight), selectionColor
+                        )
+
+                    pixmap = self._getCurrentCellPixmap(glyph)
+                    if pixmap is not None:
+                        painter.drawPixmap(left, t, pixmap)
+                    else:
+                        self._drawCellPlaceholder(
+                            painter, (left, t, cellWidth, cellHeight)
+                        )
+
+                    # XXX: this hacks around the repr internals
+                    if selected and cellHeight >= GlyphCellMinHeightForHeader:
+                        painter.fillRect(
+                            QRectF(
+                                left,
+                                t + cellHeight - GlyphCellHeaderHeight,
+                                cellWidth,
+                                GlyphCellHeaderHeight,
+                            ),
+                            selectionColor,
+                        )
+                    cellCount += 1
+            # prefetch one screen of cells above and below
+            rowSpan = lastRow - firstRow + 1
+            prefetchRange = range(
+                max(0, firstRow - rowSpan) * columnCount,
+                min(glyphCount, (lastRow + 1 + rowSpan) * columnCount),
+            )
+            for index in prefetchRange:
+                if firstRow * columnCount <= index < (lastRow + 1) * columnCount:
+                    continue
+                self._getCurrentCellPixmap(self._glyphs[index], prefetchCellPriority)
 
         # drop insertion position
         dropIndex = self._currentDropIndex
@@ -364,6 +511,13 @@ class GlyphCellWidget(QWidget):
             painter.drawPath(path)
             painter.fillPath(path, insertionPositionColor)
 
+        painter.end()
+        stats = self._paintStatistics
+        stats["count"] += 1
+        stats["cells"] = cellCount
+        stats["lastDuration"] = time.perf_counter() - paintStart
+        stats["totalDuration"] += stats["lastDuration"]
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self._calculateCellWidthExtra()
@@ -676,10 +830,9 @@ class GlyphCellWidget(QWidget):
                     self._glyphs[index] = None
         # insert newGlyphs into the list
         lst = self._glyphs[:insert] + newGlyphs + self._glyphs[insert:]
-        self._glyphs = lst
         # now, elide None
         self._currentDropIndex = None
-        self._glyphs = [glyph for glyph in self._glyphs if glyph is not None]
+        self._setGlyphs([glyph for glyph in lst if glyph is not None])
         self.setSelection(set())
         self.glyphsDropped.emit()
         self.update()
@@ -763,17 +916,19 @@ class GlyphCellView(QScrollArea):
                 font.info.removeObserver(self, "Info.Changed")
 
     def _glyphChanged(self, notification):
-        self._glyphCellWidget.update()
+        self._glyphCellWidget.invalidateCells([notification.object])
 
     def _fontChanged(self, notification):
         info = notification.object
         font = info.font
         glyphs = self._glyphCellWidget.glyphs()
         representationName = self._glyphCellWidget.cellRepresentationName()
+        fontGlyphs = []
         for glyph in glyphs:
             if glyph.font == font:
                 glyph.destroyRepresentation(representationName)
-        self._glyphCellWidget.update()
+                fontGlyphs.append(glyph)
+        self._glyphCellWidget.invalidateCells(fontGlyphs)
 
     # --------------
     # Public methods
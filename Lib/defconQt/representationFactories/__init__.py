@@ -1,6 +1,9 @@
 from defcon import Glyph, Image, registerRepresentationFactory
 
-from defconQt.representationFactories.glyphCellFactory import GlyphCellFactory
+from defconQt.representationFactories.glyphCellFactory import (
+    GlyphCellDrawingControllerFactory,
+    GlyphCellFactory,
+)
 from defconQt.representationFactories.glyphViewFactory import (
     NoComponentsQPainterPathFactory,
     OnlyComponentsQPainterPathFactory,
@@ -8,6 +11,7 @@ from defconQt.representationFactories.glyphViewFactory import (
     QPixmapFactory,
 )
 from defconQt.representationFactories.qPainterPathFactory import QPainterPathFactory
+from defconQt.tools.glyphCellRenderer import registerDrawingControllerFactory
 
 # TODO: fine-tune the destructive notifications
 _glyphFactories = {
@@ -27,6 +31,10 @@ _imageFactories = {
     )
 }
 
+_glyphCellDrawingControllerFactories = {
+    "defconQt.GlyphCell": GlyphCellDrawingControllerFactory
+}
+
 
 def registerAllFactories():
     for name, (factory, destructiveNotifications) in _glyphFactories.items():
@@ -37,3 +45,5 @@ def registerAllFactories():
         registerRepresentationFactory(
             Image, name, factory, destructiveNotifications=destructiveNotifications
         )
+    for name, factory in _glyphCellDrawingControllerFactories.items():
+        registerDrawingControllerFactory(name, factory)
@@ -1,5 +1,13 @@
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor, QFontMetrics, QPainter, QPainterPath, QPixmap
+from PyQt5.QtGui import (
+    QColor,
+    QFont,
+    QFontMetrics,
+    QImage,
+    QPainter,
+    QPainterPath,
+    QPixmap,
+)
 
 from defconQt.tools import platformSpecific
 from defconQt.tools.drawing import colorToQColor
@@ -17,7 +25,12 @@ headerFont = platformSpecific.otherUIFont()
 # TODO: fine-tune dirty appearance
 
 
-def GlyphCellFactory(
+def GlyphCellFactory(glyph, width, height, **kwargs):
+    obj = GlyphCellDrawingControllerFactory(glyph, width, height, **kwargs)
+    return obj.getPixmap()
+
+
+def GlyphCellDrawingControllerFactory(
     glyph,
     width,
     height,
@@ -27,11 +40,18 @@ def GlyphCellFactory(
     drawMetrics=None,
     pixelRatio=1.0,
 ):
+    """
+    Returns the drawing controller that :func:`GlyphCellFactory` uses to draw
+    the cell of *glyph*.
+
+    The controller gathers all the glyph data it needs upon creation, so its
+    getImage() method can be called from a worker thread.
+    """
     if drawHeader is None:
         drawHeader = height >= GlyphCellMinHeightForHeader
     if drawMetrics is None:
         drawMetrics = height >= GlyphCellMinHeightForMetrics
-    obj = GlyphCellFactoryDrawingController(
+    return GlyphCellFactoryDrawingController(
         glyph=glyph,
         font=glyph.font,
         width=width,
@@ -42,7 +62,6 @@ def GlyphCellFactory(
         drawMetrics=drawMetrics,
         pixelRatio=pixelRatio,
     )
-    return obj.getPixmap()
 
 
 class GlyphCellFactoryDrawingController:
@@ -67,6 +86,11 @@ class GlyphCellFactoryDrawingController:
 
     Subclasses may override the layer drawing methods to customize
     the appearance of cells.
+
+    The glyph and font attributes used while drawing are read upon
+    initialization, so that the cell may be drawn off the main thread with
+    getImage(). Subclasses that need more data should gather it in their
+    own __init__.
     """
 
     def __init__(
@@ -110,11 +134,70 @@ class GlyphCellFactoryDrawingController:
         self.xOffset = (width - (glyph.width * self.scale)) / 2
         self.yOffset = abs(descender * self.scale) + 0.4 * self.buffer
 
+        # snapshot of the data used while drawing
+        info = font.info
+        self.glyphName = glyph.name
+        self.glyphWidth = glyph.width
+        self.glyphDirty = glyph.dirty
+        self.markColor = glyph.markColor
+        self.ascender = info.ascender
+        self.capHeight = info.capHeight
+        self.descender = info.descender
+        self.xHeight = info.xHeight
+        self.paths = self.getGlyphPaths()
+
+    def getGlyphPaths(self):
+        """
+        Returns a list of *(QPainterPath, color)* to fill in the glyph layer,
+        from bottom to top.
+        """
+        paths = []
+        if self.shouldDrawLayers:
+            layers = self.font.layers
+            for layerName in reversed(layers.layerOrder):
+                layer = layers[layerName]
+                if self.glyph.name not in layer:
+                    continue
+                layerColor = None
+                if layer.color is not None:
+                    layerColor = colorToQColor(layer.color)
+                if layerColor is None:
+                    layerColor = QColor(Qt.black)
+                glyph = layer[self.glyph.name]
+                path = glyph.getRepresentation("defconQt.QPainterPath")
+                paths.append((QPainterPath(path), layerColor))
+        else:
+            path = self.glyph.getRepresentation("defconQt.QPainterPath")
+            paths.append((QPainterPath(path), QColor(Qt.black)))
+        return paths
+
     def getPixmap(self):
         pixmap = QPixmap(self.width * self.pixelRatio, self.height * self.pixelRatio)
         pixmap.setDevicePixelRatio(self.pixelRatio)
         pixmap.fill(Qt.transparent)
         painter = QPainter(pixmap)
+        self.drawCell(painter)
+        painter.end()
+        return pixmap
+
+    def getImage(self):
+        """
+        Returns the cell drawn into a QImage. Unlike getPixmap(), this is
+        safe to call outside of the main thread.
+        """
+        image = QImage(
+            self.width * self.pixelRatio,
+            self.height * self.pixelRatio,
+            QImage.Format_ARGB32_Premultiplied,
+        )
+        image.setDevicePixelRatio(self.pixelRatio)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        self.drawCell(painter)
+        painter.end()
+        return image
+
+    def drawCell(self, painter):
         painter.setRenderHint(QPainter.Antialiasing)
         painter.translate(0, self.height)
         painter.scale(1, -1)
@@ -164,17 +247,16 @@ class GlyphCellFactoryDrawingController:
             self.drawCellHeaderBackground(painter, headerRect)
             self.drawCellHeaderText(painter, headerRect)
             painter.restore()
-        return pixmap
 
     def drawCellBackground(self, painter, rect):
         if self.shouldDrawMarkColor:
-            markColor = self.glyph.markColor
+            markColor = self.markColor
             if markColor is not None:
                 color = colorToQColor(markColor)
                 color.setAlphaF(0.7 * color.alphaF())
                 painter.fillRect(*(rect + (color,)))
         if self.shouldDrawHeader:
-            if self.glyph.dirty:
+            if self.glyphDirty:
                 x, _, w, _ = rect
                 painter.fillRect(*(rect + (cellDirtyColor,)))
                 path = QPainterPath()
@@ -186,21 +268,16 @@ class GlyphCellFactoryDrawingController:
 
     def drawCellHorizontalMetrics(self, painter, rect):
         xMin, yMin, _, _ = rect
-        glyph = self.glyph
         scale = self.scale
         xOffset = self.xOffset
         left = round((0 * scale) + xMin + xOffset)
-        right = round((glyph.width * scale) + xMin + xOffset)
+        right = round((self.glyphWidth * scale) + xMin + xOffset)
 
-        hi = 750
-        lo = -250
-        font = self.font
         yOffset = self.yOffset
-        if font is not None:
-            ascender = font.info.ascender or 750
-            capHeight = font.info.capHeight or 750
-            hi = max(ascender, capHeight)
-            lo = font.info.descender or -250
+        ascender = self.ascender or 750
+        capHeight = self.capHeight or 750
+        hi = max(ascender, capHeight)
+        lo = self.descender or -250
         hi = round((hi * scale) + yMin + yOffset)
         lo = round((lo * scale) + yMin + yOffset)
 
@@ -213,18 +290,11 @@ class GlyphCellFactoryDrawingController:
 
     def drawCellVerticalMetrics(self, painter, rect):
         xMin, yMin, _, _ = rect
-        font = self.font
         scale = self.scale
         xOffset, yOffset = self.xOffset, self.yOffset
         left = round((0 * scale) + xMin + xOffset)
-        right = round((self.glyph.width * scale) + xMin + xOffset)
-        lines = {
-            0,
-            font.info.descender,
-            font.info.xHeight,
-            font.info.capHeight,
-            font.info.ascender,
-        }
+        right = round((self.glyphWidth * scale) + xMin + xOffset)
+        lines = {0, self.descender, self.xHeight, self.capHeight, self.ascender}
         painter.save()
         painter.setPen(cellMetricsLineColor)
         painter.setRenderHint(QPainter.Antialiasing, False)
@@ -236,23 +306,8 @@ class GlyphCellFactoryDrawingController:
         painter.restore()
 
     def drawCellGlyph(self, painter):
-        if self.shouldDrawLayers:
-            layers = self.font.layers
-            for layerName in reversed(layers.layerOrder):
-                layer = layers[layerName]
-                if self.glyph.name not in layer:
-                    continue
-                layerColor = None
-                if layer.color is not None:
-                    layerColor = colorToQColor(layer.color)
-                if layerColor is None:
-                    layerColor = Qt.black
-                glyph = layer[self.glyph.name]
-                path = glyph.getRepresentation("defconQt.QPainterPath")
-                painter.fillPath(path, layerColor)
-        else:
-            path = self.glyph.getRepresentation("defconQt.QPainterPath")
-            painter.fillPath(path, Qt.black)
+        for path, color in self.paths:
+            painter.fillPath(path, color)
 
     def drawCellForeground(self, painter, rect):
         pass
@@ -260,9 +315,9 @@ class GlyphCellFactoryDrawingController:
     def drawCellHeaderBackground(self, painter, rect):
         xMin, yMin, width, height = rect
         # background
-        if self.shouldDrawMarkColor and self.glyph.markColor is not None:
-            color = colorToQColor(self.glyph.markColor)
-        elif self.glyph.dirty:
+        if self.shouldDrawMarkColor and self.markColor is not None:
+            color = colorToQColor(self.markColor)
+        elif self.glyphDirty:
             color = cellDirtyColor
         else:
             color = Qt.white
@@ -270,12 +325,13 @@ class GlyphCellFactoryDrawingController:
 
     def drawCellHeaderText(self, painter, rect):
         _, _, width, height = rect
-        metrics = QFontMetrics(headerFont)
+        font = QFont(headerFont)
+        metrics = QFontMetrics(font)
         minOffset = painter.pen().width()
 
-        painter.setFont(headerFont)
+        painter.setFont(font)
         painter.setPen(cellMetricsTextColor)
-        name = metrics.elidedText(self.glyph.name, Qt.ElideRight, width - 2)
+        name = metrics.elidedText(self.glyphName, Qt.ElideRight, width - 2)
         painter.drawText(
             1,
             0,
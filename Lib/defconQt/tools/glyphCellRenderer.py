@@ -0,0 +1,180 @@
+"""
+The *glyphCellRenderer* submodule
+---------------------------------
+
+The *glyphCellRenderer* submodule provides an object that draws glyph cells
+on a pool of worker threads.
+
+Cells are drawn by the same drawing controllers as the glyph cell
+representation factories. A controller is created on the main thread, where
+it gathers the glyph data it needs, then its getImage() method is called on a
+worker thread. The resulting QImage_ is converted to a QPixmap_ back on the
+main thread.
+
+A drawing controller factory must be registered with
+:func:`registerDrawingControllerFactory` for each cell representation name
+that should be drawn asynchronously.
+
+.. _QImage: http://doc.qt.io/qt-5/qimage.html
+.. _QPixmap: http://doc.qt.io/qt-5/qpixmap.html
+"""
+
+from collections import defaultdict
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
+
+_drawingControllerFactories = {}
+
+
+def registerDrawingControllerFactory(representationName, factory):
+    """
+    Registers *factory* as the drawing controller factory of the glyph cell
+    representation *representationName*.
+
+    *factory* is called with the same arguments as the representation factory
+    and must return an object with a thread-safe getImage() method.
+    """
+    _drawingControllerFactories[representationName] = factory
+
+
+def drawingControllerFactory(representationName):
+    """
+    Returns the drawing controller factory registered for
+    *representationName*, or None.
+    """
+    return _drawingControllerFactories.get(representationName)
+
+
+class _RenderSignals(QObject):
+    imageRendered = pyqtSignal(object, object, QImage)
+
+
+class _RenderTask(QRunnable):
+    def __init__(self, key, controller, priority, signals):
+        super().__init__()
+        # we keep a reference to pending tasks ourselves
+        self.setAutoDelete(False)
+        self.key = key
+        self.priority = priority
+        self._controller = controller
+        self._signals = signals
+
+    def run(self):
+        image = self._controller.getImage()
+        self._controller = None
+        self._signals.imageRendered.emit(self.key, self, image)
+
+
+class GlyphCellRenderer(QObject):
+    """
+    The :class:`GlyphCellRenderer` draws glyph cells on a QThreadPool_ and
+    keeps the resulting pixmaps.
+
+    Cells are identified by a hashable *key* whose first element is the
+    glyph. Requests with a higher *priority* are drawn first. Once a cell is
+    ready, the *cellRendered* signal is emitted with its key.
+
+    .. _QThreadPool: http://doc.qt.io/qt-5/qthreadpool.html
+    """
+
+    cellRendered = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._signals = _RenderSignals(self)
+        self._signals.imageRendered.connect(self._imageRendered)
+        self._pixmaps = {}
+        self._glyphKeys = defaultdict(set)
+        self._staleKeys = set()
+        self._tasks = {}
+        # tasks that were running when their cell got invalidated, we need to
+        # hold on to them until they are done
+        self._orphanTasks = set()
+
+    def pixmap(self, key):
+        """
+        Returns the last pixmap drawn for *key*, or None. The pixmap may be
+        out of date, see :meth:`needsRender`.
+        """
+        return self._pixmaps.get(key)
+
+    def needsRender(self, key):
+        """
+        Returns whether the cell at *key* is missing or out of date and isn’t
+        being drawn already.
+        """
+        if key in self._tasks:
+            return False
+        return key not in self._pixmaps or key in self._staleKeys
+
+    def render(self, key, controller, priority=0):
+        """
+        Queues drawing of *controller* for *key*. If the cell is already queued
+        with a lower priority, it is moved ahead.
+        """
+        task = self._tasks.get(key)
+        if task is not None:
+            if task.priority >= priority or not self._pool.tryTake(task):
+                return
+        task = _RenderTask(key, controller, priority, self._signals)
+        self._tasks[key] = task
+        self._glyphKeys[key[0]].add(key)
+        self._pool.start(task, priority)
+
+    def requestRender(self, key, controllerFactory, priority=0):
+        """
+        Like :meth:`render`, but only calls *controllerFactory* to build the
+        drawing controller if the cell needs to be drawn.
+        """
+        task = self._tasks.get(key)
+        if task is not None:
+            if task.priority < priority:
+                self.render(key, task._controller, priority)
+            return
+        if self.needsRender(key):
+            self.render(key, controllerFactory(), priority)
+
+    def invalidate(self, glyphs=None):
+        """
+        Marks the cells of *glyphs* as out of date, or all cells if *glyphs*
+        is None. Pending requests for these cells are cancelled.
+
+        Out of date pixmaps are still returned by :meth:`pixmap` until they
+        are drawn again.
+        """
+        if glyphs is None:
+            keys = list(self._tasks.keys()) + list(self._pixmaps.keys())
+        else:
+            keys = []
+            for glyph in glyphs:
+                keys.extend(self._glyphKeys.get(glyph, ()))
+        for key in keys:
+            self._cancel(key)
+            if key in self._pixmaps:
+                self._staleKeys.add(key)
+
+    def clear(self):
+        """
+        Cancels all pending requests and drops all pixmaps.
+        """
+        for key in list(self._tasks.keys()):
+            self._cancel(key)
+        self._pixmaps.clear()
+        self._glyphKeys.clear()
+        self._staleKeys.clear()
+
+    def _cancel(self, key):
+        task = self._tasks.pop(key, None)
+        if task is not None and not self._pool.tryTake(task):
+            self._orphanTasks.add(task)
+
+    def _imageRendered(self, key, task, image):
+        if self._tasks.get(key) is not task:
+            self._orphanTasks.discard(task)
+            return
+        del self._tasks[key]
+        self._pixmaps[key] = QPixmap.fromImage(image)
+        self._staleKeys.discard(key)
+        self.cellRendered.emit(key)
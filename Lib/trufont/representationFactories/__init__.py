@@ -1,6 +1,10 @@
 from defcon import Component, Glyph, registerRepresentationFactory
 
-from trufont.representationFactories.glyphCellFactory import TFGlyphCellFactory
+from defconQt.tools.glyphCellRenderer import registerDrawingControllerFactory
+from trufont.representationFactories.glyphCellFactory import (
+    TFGlyphCellDrawingControllerFactory,
+    TFGlyphCellFactory,
+)
 from trufont.representationFactories.glyphViewFactory import (
     ComponentQPainterPathFactory,
     FilterSelectionFactory,
@@ -33,6 +37,10 @@ _componentFactories = {
     )
 }
 
+_glyphCellDrawingControllerFactories = {
+    "TruFont.GlyphCell": TFGlyphCellDrawingControllerFactory
+}
+
 
 def registerAllFactories():
     for name, (factory, destructiveNotifications) in _glyphFactories.items():
@@ -43,3 +51,5 @@ def registerAllFactories():
         registerRepresentationFactory(
             Component, name, factory, destructiveNotifications=destructiveNotifications
         )
+    for name, factory in _glyphCellDrawingControllerFactories.items():
+        registerDrawingControllerFactory(name, factory)
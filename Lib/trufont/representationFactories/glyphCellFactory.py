@@ -9,7 +9,12 @@ from defconQt.representationFactories.glyphCellFactory import (
 from defconQt.tools import platformSpecific
 
 
-def TFGlyphCellFactory(
+def TFGlyphCellFactory(glyph, width, height, **kwargs):
+    obj = TFGlyphCellDrawingControllerFactory(glyph, width, height, **kwargs)
+    return obj.getPixmap()
+
+
+def TFGlyphCellDrawingControllerFactory(
     glyph,
     width,
     height,
@@ -23,7 +28,7 @@ def TFGlyphCellFactory(
         drawHeader = height >= GlyphCellMinHeightForHeader
     if drawMetrics is None:
         drawMetrics = height >= GlyphCellMinHeightForMetrics
-    obj = TFGlyphCellFactoryDrawingController(
+    return TFGlyphCellFactoryDrawingController(
         glyph=glyph,
         font=glyph.font,
         width=width,
@@ -34,7 +39,6 @@ def TFGlyphCellFactory(
         drawMetrics=drawMetrics,
         pixelRatio=pixelRatio,
     )
-    return obj.getPixmap()
 
 
 class TFGlyphCellFactoryDrawingController(GlyphCellFactoryDrawingController):
@@ -45,24 +49,26 @@ class TFGlyphCellFactoryDrawingController(GlyphCellFactoryDrawingController):
             drawTemplate = True
         super().__init__(*args, **kwargs)
         self.shouldDrawTemplate = drawTemplate
+        self.glyphTemplate = self.glyph.template
+        self.glyphUnicode = self.glyph.unicode
 
     def drawCellHorizontalMetrics(self, painter, rect):
-        if not self.glyph.template:
+        if not self.glyphTemplate:
             super().drawCellHorizontalMetrics(painter, rect)
 
     def drawCellVerticalMetrics(self, painter, rect):
-        if not self.glyph.template:
+        if not self.glyphTemplate:
             super().drawCellVerticalMetrics(painter, rect)
 
     def drawCellForeground(self, painter, rect):
-        if self.shouldDrawTemplate and self.glyph.template:
+        if self.shouldDrawTemplate and self.glyphTemplate:
             painter.save()
             font = platformSpecific.otherUIFont()
             font.setPointSize(int(0.425 * self.height))
             painter.setFont(font)
             painter.setPen(Qt.lightGray)
-            if self.glyph.unicode is not None:
-                uni = self.glyph.unicode
+            if self.glyphUnicode is not None:
+                uni = self.glyphUnicode
             else:
                 uni = 0xFFFD
             painter.drawText(
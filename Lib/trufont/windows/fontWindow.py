@@ -519,21 +519,22 @@ class FontWindow(BaseWindow):
         font = self._font
         glyphOrder = font.glyphOrder
         if glyphOrder:
-            glyphCount = 0
             glyphs = []
+            glyphNames = set()
             for glyphName in glyphOrder:
                 if glyphName in font:
                     glyph = font[glyphName]
-                    glyphCount += 1
                 else:
                     glyph = font.get(glyphName, asTemplate=True)
+                glyphNames.add(glyphName)
                 glyphs.append(glyph)
-            if glyphCount < len(font):
+            if len(glyphNames) < len(font):
                 # if some glyphs in the font are not present in the glyph
                 # order, loop again to add them at the end
-                for glyph in font:
-                    if glyph not in glyphs:
-                        glyphs.append(glyph)
+                for glyphName in font.keys():
+                    if glyphName not in glyphNames:
+                        glyphNames.add(glyphName)
+                        glyphs.append(font[glyphName])
                 font.disableNotifications(observer=self)
                 font.glyphOrder = [glyph.name for glyph in glyphs]
                 font.enableNotifications(observer=self)
@@ -279,7 +279,7 @@ class GroupCellWidget(GlyphCellWidget):
         # remove glyphs that aren't from our font or are already there
         glyphs = mimeData.glyphs()
         for index, glyph in enumerate(glyphs):
-            if glyph.font != self._font or glyph in self._glyphs:
+            if glyph.font != self._font or self.indexForGlyph(glyph) is not None:
                 del glyphs[index]
         mimeData.setGlyphs(glyphs)
         # now proceed
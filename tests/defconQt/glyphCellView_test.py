@@ -0,0 +1,82 @@
+import sys
+import time
+import unittest
+
+from defcon import Font, Glyph
+from PyQt5.QtCore import QRect
+from PyQt5.QtWidgets import QApplication
+
+from defconQt.controls.glyphCellView import GlyphCellView
+from defconQt.representationFactories import registerAllFactories
+
+
+def _makeFont(count):
+    font = Font()
+    for index in range(count):
+        font.newGlyph(f"glyph{index}")
+    return font
+
+
+class GlyphCellWidgetTest(unittest.TestCase):
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    @classmethod
+    def setUpClass(cls):
+        registerAllFactories()
+
+    def setUp(self):
+        self.view = GlyphCellView()
+        self.view.resize(500, 500)
+        self.widget = self.view._glyphCellWidget
+
+    def tearDown(self):
+        self.view.close()
+
+    def _paintViewport(self, font):
+        # glyphs only hold a weak reference to their font
+        self.font = font
+        self.view.setGlyphs([font[name] for name in font.keys()])
+        self.view.setCellSize(50)
+        self.widget.resetPaintStatistics()
+        self.widget.grab(QRect(0, 0, 500, 500))
+        return self.widget.paintStatistics()
+
+    def test_paintOnlyVisibleCells(self):
+        small = self._paintViewport(_makeFont(20))
+        self.assertEqual(small["count"], 1)
+        self.assertEqual(small["cells"], 20)
+
+        # a 500x500 viewport holds at most 10 rows of 10 cells, regardless
+        # of the glyph count
+        large = self._paintViewport(_makeFont(2000))
+        self.assertEqual(large["count"], 1)
+        self.assertLessEqual(large["cells"], 100)
+        larger = self._paintViewport(_makeFont(8000))
+        self.assertEqual(larger["cells"], large["cells"])
+
+    def test_setGlyphsPreservesSelection(self):
+        glyphs = [Glyph() for _ in range(5)]
+        self.widget.setGlyphs(glyphs)
+        self.widget.setSelection({1, 3})
+        self.widget.setGlyphs([glyphs[3], glyphs[4], glyphs[0], glyphs[2]])
+        self.assertEqual(self.widget.selection(), [0])
+        self.assertEqual(self.widget.indexForGlyph(glyphs[2]), 3)
+        self.assertIsNone(self.widget.indexForGlyph(glyphs[1]))
+
+    def test_setGlyphsReorderBenchmark(self):
+        glyphs = [Glyph() for _ in range(50000)]
+        self.widget.setGlyphs(glyphs)
+        self.widget.selectAll()
+        reordered = glyphs[::-1]
+        start = time.perf_counter()
+        self.widget.setGlyphs(reordered)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(self.widget.selection(), list(range(50000)))
+        self.assertEqual(self.widget.lastSelectedGlyph(), glyphs[-1])
+        # the former list scans took minutes here
+        self.assertLess(elapsed, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()